@@ -4,6 +4,8 @@ from typing import TypedDict
 
 from pyropust import ErrorCode, None_, Ok, Option, Result, Some, err
 
+_NONE_INT: Option[int] = None_()
+
 
 class Code(ErrorCode):
     MISSING = "missing"
@@ -169,26 +171,21 @@ def test_or_() -> None:
     assert option.unwrap() == 1
 
     # Fallback to second
-    none_option: Option[int] = Some(1).filter(lambda _x: False)
-    option = none_option.or_(Some(2))
+    option = _NONE_INT.or_(Some(2))
     assert option.unwrap() == 2
 
     # Both None_
-    none_option1: Option[int] = Some(1).filter(lambda _x: False)
-    none_option2: Option[int] = Some(2).filter(lambda _x: False)
-    option = none_option1.or_(none_option2)
+    option = _NONE_INT.or_(_NONE_INT)
     assert option.is_none()
 
 
 def test_xor() -> None:
     """Test xor for exclusive or."""
     # Exactly one Some
-    none_option1: Option[int] = Some(1).filter(lambda _x: False)
-    option = Some(1).xor(none_option1)
+    option = Some(1).xor(_NONE_INT)
     assert option.unwrap() == 1
 
-    none_option2: Option[int] = Some(2).filter(lambda _x: False)
-    option = none_option2.xor(Some(2))
+    option = _NONE_INT.xor(Some(2))
     assert option.unwrap() == 2
 
     # Both Some -> None_
@@ -196,9 +193,7 @@ def test_xor() -> None:
     assert option.is_none()
 
     # Both None_ -> None_
-    none_option3: Option[int] = Some(1).filter(lambda _x: False)
-    none_option4: Option[int] = Some(2).filter(lambda _x: False)
-    option = none_option3.xor(none_option4)
+    option = _NONE_INT.xor(_NONE_INT)
     assert option.is_none()
 
 
@@ -6,16 +6,20 @@ from pyropust import None_, Option, Some
 from tests.support import SampleCode
 
 
+def _double(x: int) -> int:
+    return x * 2
+
+
 class TestOptionMap:
     """Test Option.map() for transforming Some values."""
 
     def test_map_transforms_some_value(self) -> None:
-        opt = Some(10).map(lambda x: x * 2)
+        opt = Some(10).map(_double)
         assert opt.is_some()
         assert opt.unwrap() == 20
 
     def test_map_skips_on_none(self) -> None:
-        opt: Option[int] = None_().map(lambda x: x * 2)
+        opt: Option[int] = None_().map(_double)
         assert opt.is_none()
 
 
@@ -50,12 +54,12 @@ class TestOptionMapOr:
 
     def test_map_or_applies_function_on_some(self) -> None:
         opt = Some(5)
-        result = opt.map_or(0, lambda x: x * 2)
+        result = opt.map_or(0, _double)
         assert result == 10
 
     def test_map_or_returns_default_on_none(self) -> None:
         opt: Option[int] = None_()
-        result = opt.map_or(0, lambda x: x * 2)
+        result = opt.map_or(0, _double)
         assert result == 0
 
 
@@ -64,12 +68,12 @@ class TestOptionMapOrElse:
 
     def test_map_or_else_applies_function_on_some(self) -> None:
         opt = Some(5)
-        result = opt.map_or_else(lambda: 0, lambda x: x * 2)
+        result = opt.map_or_else(lambda: 0, _double)
         assert result == 10
 
     def test_map_or_else_computes_default_on_none(self) -> None:
         opt: Option[int] = None_()
-        result = opt.map_or_else(lambda: 42, lambda x: x * 2)
+        result = opt.map_or_else(lambda: 42, _double)
         assert result == 42
 
 
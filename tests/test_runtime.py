@@ -53,12 +53,8 @@ def test_option_unwrap() -> None:
     assert some.unwrap() == "x"
 
     assert none.is_none() is True
-    try:
+    with pytest.raises(RuntimeError):
         none.unwrap()
-    except RuntimeError:
-        pass
-    else:
-        raise AssertionError("unwrap() on None_ must raise")
 
 
 def test_result_attempt_and_catch() -> None:
@@ -70,12 +66,9 @@ def test_result_attempt_and_catch() -> None:
     assert err.is_err() is True
     assert isinstance(err.unwrap_err(), Error)
 
-    try:
+    # Non-matching exceptions must be re-raised.
+    with pytest.raises(ZeroDivisionError):
         Result.attempt(lambda: 10 / 0, ValueError)
-    except ZeroDivisionError:
-        pass
-    else:
-        raise AssertionError("non-matching exceptions must be re-raised")
 
     @catch(ValueError)
     def parse_int(value: str) -> int:
@@ -0,0 +1,42 @@
+"""Static type checking tests for Error.
+
+Everything runs under TYPE_CHECKING, so it is only analyzed by the type checkers.
+
+Run with:
+    uv run mypy --strict tests/typing/
+    uv run pyright tests/typing/
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, assert_type
+
+if TYPE_CHECKING:
+    from pyropust import Error, ErrorKind
+
+    # ==========================================================================
+    # Error properties
+    # ==========================================================================
+
+    def get_error() -> Error:
+        raise NotImplementedError
+
+    rope_err = get_error()
+
+    assert_type(rope_err.kind, ErrorKind)
+    assert_type(rope_err.code, str)
+    assert_type(rope_err.message, str)
+    assert_type(rope_err.metadata, dict[str, str])
+    assert_type(rope_err.op, str | None)
+    assert_type(rope_err.path, list[str | int])
+    assert_type(rope_err.expected, str | None)
+    assert_type(rope_err.got, str | None)
+    assert_type(rope_err.cause, str | None)
+
+    # ==========================================================================
+    # ErrorKind class attributes
+    # ==========================================================================
+
+    assert_type(ErrorKind.InvalidInput, ErrorKind)
+    assert_type(ErrorKind.NotFound, ErrorKind)
+    assert_type(ErrorKind.Internal, ErrorKind)
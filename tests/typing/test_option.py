@@ -0,0 +1,69 @@
+"""Static type checking tests for Option.
+
+Everything runs under TYPE_CHECKING, so it is only analyzed by the type checkers.
+
+Run with:
+    uv run mypy --strict tests/typing/
+    uv run pyright tests/typing/
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Never, assert_type
+
+if TYPE_CHECKING:
+    from pyropust import None_, Option, Some
+
+    # ==========================================================================
+    # Option: Constructors
+    # ==========================================================================
+
+    # Some() returns Option[T]
+    some_int: Option[int] = Some(42)
+    assert_type(Some(42), Option[int])
+    assert_type(Some("hello"), Option[str])
+
+    # None_() returns Option[Never]
+    none_val: Option[Never] = None_()
+    assert_type(None_(), Option[Never])
+
+    # ==========================================================================
+    # Option: Methods
+    # ==========================================================================
+
+    def get_option() -> Option[int]:
+        return Some(10)
+
+    opt = get_option()
+
+    # is_some / is_none return bool
+    assert_type(opt.is_some(), bool)
+    assert_type(opt.is_none(), bool)
+
+    # unwrap returns the value type
+    assert_type(opt.unwrap(), int)
+
+    # map transforms the value
+    mapped_opt = opt.map(lambda x: str(x))
+    assert_type(mapped_opt, Option[str])
+
+    # unwrap_or returns union of value type and default type
+    with_default = opt.unwrap_or("default")
+    assert_type(with_default, int | str)
+
+    # unwrap_or with same type
+    same_type_default = opt.unwrap_or(0)
+    assert_type(same_type_default, int)
+
+    # ==========================================================================
+    # Option: README example
+    # ==========================================================================
+
+    def find_user(user_id: int) -> Option[str]:
+        return Some("Alice") if user_id == 1 else None_()
+
+    name_opt = find_user(1)
+    assert_type(name_opt, Option[str])
+
+    name = name_opt.unwrap_or("Guest")
+    assert_type(name, str)
@@ -0,0 +1,40 @@
+"""Static type checking tests for Result constructors.
+
+Everything runs under TYPE_CHECKING, so it is only analyzed by the type checkers.
+
+Run with:
+    uv run mypy --strict tests/typing/
+    uv run pyright tests/typing/
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Never, assert_type
+
+if TYPE_CHECKING:
+    from pyropust import Err, Error, Ok, Result, bail, ensure, err
+    from tests.support import SampleCode
+
+    # ==========================================================================
+    # Result: Constructors
+    # ==========================================================================
+
+    # Ok() returns Result[T]
+    ok_int: Result[int] = Ok(42)
+    assert_type(Ok(42), Result[int])
+    assert_type(Ok("hello"), Result[str])
+
+    # Err() returns Result[Never]
+    err_str: Result[Never] = err(SampleCode.ERROR, "error")
+    assert_type(err(SampleCode.ERROR, "error"), Result[Never])
+    assert_type(
+        Err(Error.new(code=SampleCode.ERROR, message="oops")),
+        Result[Never],
+    )
+    err_union: Result[Never] = err("oops.code", "oops")
+    assert_type(err_union, Result[Never])
+    assert_type(bail(SampleCode.ERROR, "boom"), Result[Never])
+    assert_type(
+        ensure(condition=True, code=SampleCode.ERROR, message="boom"),
+        Result[None],
+    )
@@ -0,0 +1,90 @@
+"""Static type checking tests for Result methods.
+
+Everything runs under TYPE_CHECKING, so it is only analyzed by the type checkers.
+
+Run with:
+    uv run mypy --strict tests/typing/
+    uv run pyright tests/typing/
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, assert_type
+
+if TYPE_CHECKING:
+    from pyropust import Error, Ok, Result, catch, err
+    from tests.support import SampleCode
+
+    # ==========================================================================
+    # Result: Methods
+    # ==========================================================================
+
+    def get_result() -> Result[int]:
+        return Ok(10)
+
+    res = get_result()
+
+    # is_ok / is_err return bool
+    assert_type(res.is_ok(), bool)
+    assert_type(res.is_err(), bool)
+
+    # unwrap returns the Ok value type
+    assert_type(res.unwrap(), int)
+
+    # unwrap_err returns the Err value type
+    assert_type(res.unwrap_err(), Error)
+
+    # unwrap_or_raise returns ok value type
+    assert_type(res.unwrap_or_raise(RuntimeError("boom")), int)
+
+    # attempt returns Result[T]
+    attempt_ok = Result.attempt(lambda: 123)
+    assert_type(attempt_ok, Result[int])
+
+    # map transforms the Ok value
+    mapped = res.map(lambda x: str(x))
+    assert_type(mapped, Result[str])
+
+    # map with different output type
+    mapped_float = res.map(lambda x: x * 2.5)
+    assert_type(mapped_float, Result[float])
+
+    # map_err transforms the Err value, preserves ok type
+    mapped_err = res.map_err(lambda e: e)
+    assert_type(mapped_err, Result[int])
+
+    # context/with_code/map_err_code return Result[T]
+    assert_type(res.context("extra context"), Result[int])
+    assert_type(res.with_code(SampleCode.ERROR), Result[int])
+    assert_type(res.map_err_code("pipeline"), Result[int])
+
+    # and_then chains Result-returning functions
+    def validate(x: int) -> Result[str]:
+        return Ok(str(x)) if x > 0 else err(SampleCode.ERROR, "negative")
+
+    chained = res.and_then(validate)
+    assert_type(chained, Result[str])
+
+    # ==========================================================================
+    # Result: Chaining (README example)
+    # ==========================================================================
+
+    # Functional chaining with explicit error type annotation
+    def fetch_value() -> Result[str]:
+        return Ok("123")
+
+    chain_result = (
+        fetch_value().map(int).map(lambda x: x * 2).and_then(lambda x: Ok(f"Value is {x}"))
+    )
+    assert_type(chain_result, Result[str])
+
+    # ==========================================================================
+    # Result: Border control helpers
+    # ==========================================================================
+
+    @catch(ValueError)
+    def parse_int(value: str) -> int:
+        return int(value)
+
+    parsed = parse_int("123")
+    assert_type(parsed, Result[int])
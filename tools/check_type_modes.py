@@ -3,194 +3,402 @@
 Mode1: E自由 (Ok[T, E] -> Result[T, E])
 Mode2: E非露出 (ResultT[T] = Result[T, Error[ErrorCode]])
 Mode3: phantom Ok (Ok[T, CodeT] -> Result[T, Error[CodeT]])
+
+Each mode is checked in its own workspace under .mypy_cache/type_modes/work
+(a copy of the package with the transformed stubs, plus the probe), so the
+repository's stubs are never modified. mypy checks the workspaces concurrently;
+pyright checks all of them in a single run, one execution environment per mode.
+
+Run with:
+    uv run python tools/check_type_modes.py [--daemon | --stop-daemons]
+
+Results are cached per mode, keyed by everything that can change them (stubs,
+probe, transforms, pyproject.toml and the mypy/pyright versions in use), so an
+unchanged mode is not rechecked. Delete the work directory to force a full rerun.
+
+With --daemon, mypy runs under one dmypy server per mode. The servers are left
+running, so later runs only recheck what changed; --stop-daemons shuts them down.
 """
 
 from __future__ import annotations
 
+import argparse
+import ast
+import functools
+import hashlib
+import json
 import re
+import shutil
 import subprocess
+import tomllib
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import NamedTuple
+
+from gen_native_stub import extract_native_stub
 
 ROOT = Path(__file__).resolve().parent.parent
-INIT_PYI = ROOT / "pyropust" / "__init__.pyi"
-NATIVE_STUB = ROOT / "pyropust" / "pyropust_native.pyi"
+PACKAGE = ROOT / "pyropust"
+INIT_PYI = PACKAGE / "__init__.pyi"
 PROBE = ROOT / "tests" / "typing" / "type_mode_probe.py"
-PROBE_MODE2B = ROOT / "tests" / "typing" / "type_mode_probe_mode2b.py"
+MYPY_CACHE_ROOT = ROOT / ".mypy_cache" / "type_modes"
+# Per checkout, so concurrent runs from other checkouts or users never share workspaces,
+# and at a fixed location so mypy's incremental cache sees stable paths across runs.
+WORK_ROOT = MYPY_CACHE_ROOT / "work"
+RESULTS = WORK_ROOT / "results.json"
+# Holds both checkers' configuration; any change to it must invalidate cached results.
+PYPROJECT = ROOT / "pyproject.toml"
+# Editing the transforms must invalidate workspaces built by an older version of them.
+TRANSFORM_SOURCES = (Path(__file__).resolve(), ROOT / "tools" / "gen_native_stub.py")
+
+
+RESULT_ALIAS = "type ResultT[T] = Result[T, Error[ErrorCode]]"
+
+_RESULT_CLASS = re.compile(r"^class Result\b", re.MULTILINE)
+
+# Literal rewrites for the Error-only variant. Matching them longest-first in one pass
+# gives the same result as applying them one after another.
+_MODE2B_TABLE = {
+    "class Error[CodeT: ErrorCode]:": "class Error:",
+    "Error[CodeT]": "Error",
+    "Error[ErrorCode]": "Error",
+    "code: CodeT": "code: str",
+    "code: CodeT | str": "code: str",
+    "str | str": "str",
+    "def Err[CodeT: ErrorCode](error: Error[CodeT])": "def Err(error: Error)",
+    "def err[CodeT: ErrorCode](": "def err(",
+    "def bail[CodeT: ErrorCode](": "def bail(",
+    "def ensure[CodeT: ErrorCode](": "def ensure(",
+    "-> Result[T_co, Error[CodeT]]": "-> Result[T_co, Error]",
+    "-> Result[U, Error[CodeT]]": "-> Result[U, Error]",
+    "-> Result[Option[U], Error[CodeT]]": "-> Result[Option[U], Error]",
+    "Result[T_co, Error[CodeT]]": "Result[T_co, Error]",
+    "Result[U, Error[CodeT]]": "Result[U, Error]",
+    "Result[Option[U], Error[CodeT]]": "Result[Option[U], Error]",
+    "Result[Never, Error[CodeT]]": "Result[Never, Error]",
+    "Result[None, Error[CodeT]]": "Result[None, Error]",
+    "-> Error[CodeT]": "-> Error",
+    "Error[CodeT] | None": "Error | None",
+    "Error[CodeT],": "Error,",
+    "Error[CodeT])": "Error)",
+    "CodeT: ErrorCode": "",
+}
+_MODE2B_RE = re.compile(
+    "|".join(re.escape(k) for k in sorted(_MODE2B_TABLE, key=len, reverse=True)),
+)
+# Dangling type parameter lists left behind once CodeT is dropped.
+_TRAIL_COMMA_RE = re.compile(r"\[([A-Za-z0-9_]+),\s*\]")
+_LEAD_COMMA_RE = re.compile(r"\[\s*,\s*([A-Za-z0-9_]+)\]")
+_DEF_EMPTY_RE = re.compile(r"(def\s+[A-Za-z0-9_]+)\[\]\(")
+_CLASS_EMPTY_RE = re.compile(r"(class\s+[A-Za-z0-9_]+)\[\]\:")
+# Covers Result[int, Error[Code]] and friends too: only the Error parameter changes.
+_PROBE_ERROR_PARAM = re.compile(r"Error\[(?:Code|ErrorCode)\]")
+
+
+def _run(cmd: list[str]) -> tuple[int, str]:
+    proc = subprocess.run(cmd, check=False, capture_output=True, text=True)  # noqa: S603
+    return proc.returncode, proc.stdout + proc.stderr
+
+
+def _run_mypy(args: list[str], status_file: Path | None = None) -> tuple[int, str]:
+    if status_file is not None:
+        # `dmypy run` starts the server on first use and reuses it afterwards.
+        return _run(["uv", "run", "dmypy", "--status-file", str(status_file), "run", "--", *args])
+    # Inside the project environment, run mypy in this (worker) process rather than
+    # paying for another interpreter start and mypy import per mode.
+    try:
+        from mypy import api  # noqa: PLC0415
+    except ModuleNotFoundError:
+        return _run(["uv", "run", "mypy", *args])
+    stdout, stderr, code = api.run(args)
+    return code, stdout + stderr
+
 
+@functools.cache
+def _ok_spans(text: str) -> tuple[tuple[int, int], ...]:
+    # 0-based [start, end) line spans of each top-level `def Ok`, decorators included.
+    # Cached because modes 1-3 all rewrite the same stub.
+    return tuple(
+        (
+            min([node.lineno, *(d.lineno for d in node.decorator_list)]) - 1,
+            node.end_lineno or node.lineno,
+        )
+        for node in ast.parse(text).body
+        if isinstance(node, ast.FunctionDef) and node.name == "Ok"
+    )
 
-OK_MARKER = "def Ok"
 
+def _mypy_version(*, daemon: bool) -> str:
+    # Ask the mypy that _run_mypy will use; the daemon always runs through uv.
+    if not daemon:
+        try:
+            from mypy.version import __version__  # noqa: PLC0415
+        except ModuleNotFoundError:
+            pass
+        else:
+            return __version__
+    return _run(["uv", "run", "mypy", "--version"])[1]
 
-def _run(cmd: list[str]) -> int:
-    return subprocess.run(cmd, check=False).returncode  # noqa: S603
 
+def _pyright_version() -> str:
+    return _run(["uv", "run", "pyright", "--version"])[1]
 
-def _gen_native_stub() -> None:
-    code = _run(["python3", str(ROOT / "tools" / "gen_native_stub.py")])
-    if code != 0:
-        raise SystemExit(code)
+
+def _replace_ok(text: str, signature: str) -> str:
+    # Splice the source lines rather than ast.unparse, which would drop the stub's comments.
+    lines = text.splitlines(keepends=True)
+    for start, end in reversed(_ok_spans(text)):
+        lines[start:end] = [f"{signature}\n"]
+    out = "".join(lines)
+    return out if out.endswith("\n") else out + "\n"
 
 
 def _mode1(text: str) -> str:
     # Replace Ok overloads / signature with E-generic Ok.
-    lines: list[str] = []
-    src = text.splitlines()
-    i = 0
-    while i < len(src):
-        line = src[i]
-        if line.lstrip().startswith("@overload"):
-            # Skip @overload if next non-empty line is def Ok
-            j = i + 1
-            while j < len(src) and src[j].strip() == "":
-                j += 1
-            if j < len(src) and src[j].lstrip().startswith("def Ok"):
-                i += 1
-                continue
-        if line.lstrip().startswith("def Ok"):
-            lines.append("def Ok[T, E](value: T) -> Result[T, E]: ...")
-            i += 1
-            continue
-        lines.append(line)
-        i += 1
-    return "\n".join(lines) + "\n"
+    return _replace_ok(text, "def Ok[T, E](value: T) -> Result[T, E]: ...")
 
 
 def _mode2(text: str) -> str:
     # Keep Result generic but add a public alias and pin Ok to it.
-    lines: list[str] = []
-    src = text.splitlines()
-    inserted_alias = False
-    i = 0
-    while i < len(src):
-        line = src[i]
-        if line.lstrip().startswith("@overload"):
-            # Skip @overload if next non-empty line is def Ok
-            j = i + 1
-            while j < len(src) and src[j].strip() == "":
-                j += 1
-            if j < len(src) and src[j].lstrip().startswith("def Ok"):
-                i += 1
-                continue
-        if not inserted_alias and line.startswith("class Result"):
-            lines.append("type ResultT[T] = Result[T, Error[ErrorCode]]")
-            inserted_alias = True
-        if line.lstrip().startswith("def Ok"):
-            lines.append("def Ok[T](value: T) -> ResultT[T]: ...")
-            i += 1
-            continue
-        lines.append(line)
-        i += 1
-    if not inserted_alias:
-        lines.append("type ResultT[T] = Result[T, Error[ErrorCode]]")
-    return "\n".join(lines) + "\n"
+    out = _replace_ok(text, "def Ok[T](value: T) -> ResultT[T]: ...")
+    out, inserted = _RESULT_CLASS.subn(f"{RESULT_ALIAS}\n\\g<0>", out, count=1)
+    if not inserted:
+        out += f"{RESULT_ALIAS}\n"
+    return out
 
 
 def _mode3(text: str) -> str:
     # Phantom generic Ok: infer CodeT from context (no _code_type param).
-    lines: list[str] = []
-    src = text.splitlines()
-    i = 0
-    while i < len(src):
-        line = src[i]
-        if line.lstrip().startswith("@overload"):
-            # Skip @overload if next non-empty line is def Ok
-            j = i + 1
-            while j < len(src) and src[j].strip() == "":
-                j += 1
-            if j < len(src) and src[j].lstrip().startswith("def Ok"):
-                i += 1
-                continue
-        if line.lstrip().startswith("def Ok"):
-            lines.append("def Ok[T, CodeT: ErrorCode](value: T) -> Result[T, Error[CodeT]]: ...")
-            i += 1
-            continue
-        lines.append(line)
-        i += 1
-    return "\n".join(lines) + "\n"
+    return _replace_ok(
+        text, "def Ok[T, CodeT: ErrorCode](value: T) -> Result[T, Error[CodeT]]: ..."
+    )
 
 
 def _mode2b(text: str) -> str:
     # Error-only (non-generic) variant: Error has no CodeT.
     # Replace Error[CodeT] -> Error, and CodeT parameters -> str.
-    out = text
-    out = out.replace("class Error[CodeT: ErrorCode]:", "class Error:")
-    out = out.replace("Error[CodeT]", "Error")
-    out = out.replace("Error[ErrorCode]", "Error")
-    out = out.replace("code: CodeT", "code: str")
-    out = out.replace("code: CodeT | str", "code: str")
-    out = out.replace("str | str", "str")
-    out = out.replace("def Err[CodeT: ErrorCode](error: Error[CodeT])", "def Err(error: Error)")
-    out = out.replace("def err[CodeT: ErrorCode](", "def err(")
-    out = out.replace("def bail[CodeT: ErrorCode](", "def bail(")
-    out = out.replace("def ensure[CodeT: ErrorCode](", "def ensure(")
-    out = out.replace("-> Result[T_co, Error[CodeT]]", "-> Result[T_co, Error]")
-    out = out.replace("-> Result[U, Error[CodeT]]", "-> Result[U, Error]")
-    out = out.replace("-> Result[Option[U], Error[CodeT]]", "-> Result[Option[U], Error]")
-    out = out.replace("Result[T_co, Error[CodeT]]", "Result[T_co, Error]")
-    out = out.replace("Result[U, Error[CodeT]]", "Result[U, Error]")
-    out = out.replace("Result[Option[U], Error[CodeT]]", "Result[Option[U], Error]")
-    out = out.replace("Result[Never, Error[CodeT]]", "Result[Never, Error]")
-    out = out.replace("Result[None, Error[CodeT]]", "Result[None, Error]")
-    out = out.replace("-> Error[CodeT]", "-> Error")
-    out = out.replace("Error[CodeT]", "Error")
-    out = out.replace("Error[CodeT] | None", "Error | None")
-    out = out.replace("Error[CodeT],", "Error,")
-    out = out.replace("Error[CodeT])", "Error)")
-    out = out.replace("CodeT: ErrorCode", "")
+    out = _MODE2B_RE.sub(lambda m: _MODE2B_TABLE[m.group(0)], text)
     # Clean up dangling type parameter lists like [U, ] after CodeT removal.
-    out = re.sub(r"\[([A-Za-z0-9_]+),\s*\]", r"[\1]", out)
-    out = re.sub(r"\[\s*,\s*([A-Za-z0-9_]+)\]", r"[\1]", out)
-    out = re.sub(r"(def\s+[A-Za-z0-9_]+)\[\]\(", r"\1(", out)
-    out = re.sub(r"(class\s+[A-Za-z0-9_]+)\[\]\:", r"\1:", out)
-    return out  # noqa: RET504
+    out = _TRAIL_COMMA_RE.sub(r"[\1]", out)
+    out = _LEAD_COMMA_RE.sub(r"[\1]", out)
+    out = _DEF_EMPTY_RE.sub(r"\1(", out)
+    return _CLASS_EMPTY_RE.sub(r"\1:", out)
 
 
-def _write_probe_mode2b() -> None:
-    # Create a probe variant that uses non-generic Error.
-    text = PROBE.read_text()
-    text = text.replace("Error[Code]", "Error")
-    text = text.replace("Error[ErrorCode]", "Error")
-    text = text.replace("Result[int, Error[Code]]", "Result[int, Error]")
-    text = text.replace("Result[str, Error[Code]]", "Result[str, Error]")
-    text = text.replace("Result[int, Error[ErrorCode]]", "Result[int, Error]")
-    PROBE_MODE2B.write_text(text)
+def _probe_mode2b(text: str) -> str:
+    # Probe variant that uses non-generic Error.
+    return _PROBE_ERROR_PARAM.sub("Error", text)
 
 
-def _check(label: str, probe: Path) -> None:
-    print(f"\n=== {label} ===")  # noqa: T201
-    mypy_code = _run(["uv", "run", "mypy", "--strict", str(probe)])
-    pyright_code = _run(["uv", "run", "pyright", str(probe)])
-    print(f"[{label}] mypy exit: {mypy_code}, pyright exit: {pyright_code}")  # noqa: T201
+def _same(text: str) -> str:
+    return text
 
 
-def main() -> None:
-    original = INIT_PYI.read_text()
+class Mode(NamedTuple):
+    name: str
+    label: str
+    stub: Callable[[str], str]
+    probe: Callable[[str], str] = _same
+
+
+MODES = (
+    Mode("mode1", "mode1 (E自由)", _mode1),
+    Mode("mode2", "mode2 (E非露出)", _mode2),
+    Mode("mode3", "mode3 (phantom Ok)", _mode3),
+    Mode("mode2b", "mode2b (Error only)", _mode2b, _probe_mode2b),
+)
+
+
+def _pyright_config() -> dict[str, object]:
+    settings = tomllib.loads(PYPROJECT.read_text())["tool"]["pyright"]
+    # Paths in the project config are relative to ROOT and meaningless under WORK_ROOT.
+    config = {k: v for k, v in settings.items() if k not in {"venvPath", "exclude"}}
+    # Each workspace resolves `pyropust` to its own transformed copy.
+    config["executionEnvironments"] = [{"root": mode.name} for mode in MODES]
+    return config
+
+
+def _fingerprint(*parts: str) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(part.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _write_if_changed(path: Path, text: str) -> None:
+    # An untouched file keeps its mtime, so mypy's cache can skip rehashing it.
+    data = text.encode()
     try:
-        # Mode 1
-        INIT_PYI.write_text(_mode1(original))
-        _gen_native_stub()
-        _check("mode1 (E自由)", PROBE)
-
-        # Mode 2
-        INIT_PYI.write_text(_mode2(original))
-        _gen_native_stub()
-        _check("mode2 (E非露出)", PROBE)
-
-        # Mode 3 (phantom Ok)
-        INIT_PYI.write_text(_mode3(original))
-        _gen_native_stub()
-        _check("mode3 (phantom Ok)", PROBE)
-
-        # Mode 2b (Error only)
-        INIT_PYI.write_text(_mode2b(original))
-        _gen_native_stub()
-        _write_probe_mode2b()
-        _check("mode2b (Error only)", PROBE_MODE2B)
-    finally:
-        INIT_PYI.write_text(original)
-        _gen_native_stub()
-        if PROBE_MODE2B.exists():
-            PROBE_MODE2B.unlink()
+        if path.read_bytes() == data:
+            return
+    except FileNotFoundError:
+        pass
+    path.write_bytes(data)
+
+
+def _prepare_workspace(mode: Mode, inputs: tuple[str, ...]) -> Path:
+    stub, probe = inputs[:2]
+    workspace = WORK_ROOT / mode.name
+    package = workspace / PACKAGE.name
+    shutil.copytree(
+        PACKAGE,
+        package,
+        dirs_exist_ok=True,
+        ignore=shutil.ignore_patterns("__pycache__", "*.so", "*.pyd", "*.pyi"),
+    )
+    # The stubs and probe are pure functions of the inputs; reuse the last run's.
+    marker = workspace / ".fingerprint"
+    fingerprint = _fingerprint(mode.name, *inputs)
+    if marker.is_file() and marker.read_text() == fingerprint:
+        return workspace
+
+    stub = mode.stub(stub)
+    _write_if_changed(package / INIT_PYI.name, stub)
+    _write_if_changed(package / "pyropust_native.pyi", extract_native_stub(stub))
+    _write_if_changed(workspace / PROBE.name, mode.probe(probe))
+    marker.write_text(fingerprint)
+    return workspace
+
+
+class CheckResult(NamedTuple):
+    mypy_code: int
+    mypy_out: str
+    pyright_code: int
+    pyright_out: str
+
+
+def _is_cacheable(result: CheckResult) -> bool:
+    # Exit codes above 1 mean a checker crashed, was missing or rejected its config
+    # (pyright reports those even when it still prints JSON); always retry them.
+    return result.mypy_code in {0, 1} and result.pyright_code in {0, 1}
+
+
+def _load_results() -> dict[str, CheckResult]:
+    try:
+        cached = json.loads(RESULTS.read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    results = {key: CheckResult(*entry) for key, entry in cached.items()}
+    return {key: result for key, result in results.items() if _is_cacheable(result)}
+
+
+def _save_results(results: dict[str, CheckResult]) -> None:
+    kept = {key: result for key, result in results.items() if _is_cacheable(result)}
+    # Write-then-rename so an interrupted run never leaves a truncated cache behind.
+    tmp = RESULTS.with_suffix(".tmp")
+    tmp.write_text(json.dumps(kept, indent=2))
+    tmp.replace(RESULTS)
+
+
+def _status_file(mode: Mode) -> Path:
+    return WORK_ROOT / mode.name / ".dmypy.json"
+
+
+def _stop_daemons() -> None:
+    for mode in MODES:
+        status_file = _status_file(mode)
+        if status_file.is_file():
+            _, out = _run(["uv", "run", "dmypy", "--status-file", str(status_file), "stop"])
+            print(f"[{mode.label}] {out.strip()}")  # noqa: T201
+
+
+def _check_mypy(mode: Mode, workspace: Path, *, daemon: bool) -> tuple[int, str]:
+    # Each mode gets its own mypy cache so switching stubs doesn't invalidate the others.
+    # The workspaces can't share one mypy run: each has its own `pyropust` package.
+    cache_dir = MYPY_CACHE_ROOT / mode.name
+    return _run_mypy(
+        ["--strict", "--cache-dir", str(cache_dir), str(workspace / PROBE.name)],
+        status_file=_status_file(mode) if daemon else None,
+    )
+
+
+def _check_pyright(workspaces: list[Path]) -> list[tuple[int, str]]:
+    # pyright's startup and typeshed parsing dwarf a probe check, so pay for them once.
+    probes = [str(ws / PROBE.name) for ws in workspaces]
+    cmd = ["uv", "run", "pyright", "--outputjson", "--project", str(WORK_ROOT), *probes]
+    proc = subprocess.run(cmd, check=False, capture_output=True, text=True)  # noqa: S603
+    try:
+        diagnostics = json.loads(proc.stdout)["generalDiagnostics"]
+    except (json.JSONDecodeError, KeyError):
+        diagnostics = None
+    # Exit codes above 1 are fatal, config or usage errors, even when stdout is still JSON.
+    if diagnostics is None or proc.returncode > 1:
+        # pyright itself failed; every mode gets its full output and exit code.
+        return [(proc.returncode, proc.stdout + proc.stderr)] * len(workspaces)
+
+    results: list[tuple[int, str]] = []
+    for ws in workspaces:
+        lines: list[str] = []
+        errors = 0
+        for diag in diagnostics:
+            if not Path(diag["file"]).is_relative_to(ws):
+                continue
+            start = diag["range"]["start"]
+            lines.append(
+                f"  {diag['file']}:{start['line'] + 1}:{start['character'] + 1}"
+                f" - {diag['severity']}: {diag['message']}\n"
+            )
+            errors += diag["severity"] == "error"
+        lines.append(f"{errors} errors, {len(lines) - errors} other diagnostics\n")
+        # stderr carries config warnings that never make it into the JSON.
+        results.append((int(errors > 0), "".join(lines) + proc.stderr))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Check type behavior of the stub variants.")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--daemon", action="store_true", help="check with long-lived dmypy servers")
+    group.add_argument(
+        "--stop-daemons", action="store_true", help="stop the dmypy servers and exit"
+    )
+    args = parser.parse_args()
+    if args.stop_daemons:
+        _stop_daemons()
+        return
+    inputs = (
+        INIT_PYI.read_text(),
+        PROBE.read_text(),
+        *(path.read_text() for path in TRANSFORM_SOURCES),
+    )
+    pyright_config = json.dumps(_pyright_config(), indent=2)
+    # The installed checkers, not uv.lock: the in-process mypy is whatever this interpreter has.
+    environment = (PYPROJECT.read_text(), _mypy_version(daemon=args.daemon), _pyright_version())
+    keys = {mode: _fingerprint(mode.name, *inputs, *environment) for mode in MODES}
+    results = _load_results()
+    pending = [mode for mode in MODES if keys[mode] not in results]
+
+    if pending:
+        workspaces = [_prepare_workspace(mode, inputs) for mode in pending]
+        _write_if_changed(WORK_ROOT / "pyrightconfig.json", pyright_config)
+        with ProcessPoolExecutor(max_workers=len(pending)) as pool:
+            futures = [
+                pool.submit(_check_mypy, mode, ws, daemon=args.daemon)
+                for mode, ws in zip(pending, workspaces, strict=True)
+            ]
+            # The mypy checks run in the pool while pyright covers every mode from here.
+            pyright_results = _check_pyright(workspaces)
+            for mode, future, pyright_result in zip(pending, futures, pyright_results, strict=True):
+                results[keys[mode]] = CheckResult(*future.result(), *pyright_result)
+        # Only the current keys are kept, so the cache never outgrows one entry per mode.
+        _save_results({key: results[key] for key in keys.values()})
+
+    for mode in MODES:
+        result = results[keys[mode]]
+        cached = "" if mode in pending else " (cached)"
+        print(  # noqa: T201
+            f"\n=== {mode.label} ===\n{result.mypy_out}{result.pyright_out}"
+            f"[{mode.label}] mypy exit: {result.mypy_code}, "
+            f"pyright exit: {result.pyright_code}{cached}"
+        )
+
+    running = [path for path in map(_status_file, MODES) if path.is_file()]
+    if running:
+        print("\ndmypy servers still running (stop them with --stop-daemons):")  # noqa: T201
+        for path in running:
+            print(f"  {path}")  # noqa: T201
 
 
 if __name__ == "__main__":
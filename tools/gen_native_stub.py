@@ -117,6 +117,11 @@ def main() -> None:
     print("🔧 Extracting native module types...")
     native_content = extract_native_stub(init_content)
 
+    # The output is a pure function of __init__.pyi; leave an up-to-date file (and its mtime) alone.
+    if native_pyi.is_file() and native_pyi.read_text() == native_content:
+        print(f"✅ {native_pyi} is up to date.")
+        return
+
     print(f"📝 Writing {native_pyi}...")
     native_pyi.write_text(native_content)
 